@@ -97,9 +97,9 @@ class LLMAgent(BaseAgent):
         if prompt_path is None:
             prompt_path = PROMPTS_DIR / agency_id / f"{agent_name}.md"
 
-        if prompt_path.exists():
+        try:
             system_prompt = prompt_path.read_text()
-        else:
+        except FileNotFoundError:
             system_prompt = f"You are the {agent_name} agent for the {agency_id} agency."
 
         # Convert agent_name to display name
@@ -1,6 +1,7 @@
 """BaseAgent - executes LLM calls with structured output."""
 
 import json
+import re
 import time
 import uuid
 from typing import Any, Callable, TYPE_CHECKING
@@ -11,10 +12,25 @@ from rilai.contracts.events import EventKind
 if TYPE_CHECKING:
     from rilai.runtime.workspace import Workspace
 
+# Compiled once - _extract_json runs per agent per turn, and going
+# through re's module-level cache still costs a hash + dict lookup
+_CODEBLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# orjson parses small payloads 2-3x faster than stdlib json; optional
+# (pip install rilai[fast]), with the same loads semantics for our use
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class BaseAgent:
     """Agent that makes LLM calls with structured JSON output."""
 
+    # Slots: ~50 of these exist and their attributes are read on every
+    # turn - slot descriptors skip the per-instance __dict__ lookup
+    __slots__ = ("manifest", "prompt_template", "agent_id")
+
     def __init__(self, manifest: AgentManifest, prompt_template: str):
         self.manifest = manifest
         self.prompt_template = prompt_template
@@ -36,9 +52,12 @@ class BaseAgent:
         """
         start_time = time.monotonic()
 
+        # agent_id is touched on every branch below - bind it once
+        agent_id = self.agent_id
+
         # Emit start event
         if emit_fn:
-            emit_fn(EventKind.AGENT_STARTED, {"agent_id": self.agent_id})
+            emit_fn(EventKind.AGENT_STARTED, {"agent_id": agent_id})
 
         try:
             # Build prompt
@@ -49,14 +68,17 @@ class BaseAgent:
 
             # Parse response
             output = self._parse_response(response)
-            output.processing_time_ms = int((time.monotonic() - start_time) * 1000)
+            # Quiet outputs are interned and shared across turns - never
+            # stamp timing onto the shared instance
+            if output is not AgentOutput.quiet(agent_id):
+                output.processing_time_ms = int((time.monotonic() - start_time) * 1000)
 
             # Emit completion event
             if emit_fn:
                 emit_fn(
                     EventKind.AGENT_COMPLETED,
                     {
-                        "agent_id": self.agent_id,
+                        "agent_id": agent_id,
                         "observation": output.observation,
                         "salience": output.salience,
                         "urgency": output.urgency,
@@ -72,9 +94,9 @@ class BaseAgent:
             if emit_fn:
                 emit_fn(
                     EventKind.AGENT_FAILED,
-                    {"agent_id": self.agent_id, "error": str(e)},
+                    {"agent_id": agent_id, "error": str(e)},
                 )
-            return AgentOutput.quiet(self.agent_id)
+            return AgentOutput.quiet(agent_id)
 
     async def _call_llm(self, prompt: str) -> str:
         """Make LLM call. Can be overridden for testing."""
@@ -166,23 +188,21 @@ If nothing to report: {{"observation": "Quiet", "urgency": 0, "confidence": 0, "
 
     def _extract_json(self, content: str) -> dict:
         """Extract JSON from response (handles markdown code blocks)."""
-        import re
-
-        # Try direct parse
+        # Try direct parse; both parsers raise a ValueError subclass
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return _json_loads(content)
+        except ValueError:
             pass
 
         # Try extracting from code block
-        match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+        match = _CODEBLOCK_RE.search(content)
         if match:
-            return json.loads(match.group(1))
+            return _json_loads(match.group(1))
 
         # Try finding first { to last }
         start = content.find('{')
         end = content.rfind('}')
         if start != -1 and end != -1:
-            return json.loads(content[start:end+1])
+            return _json_loads(content[start:end+1])
 
         raise ValueError("No JSON found in response")
@@ -1,5 +1,6 @@
 """Agent registry - loads and manages agents."""
 
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict
 
@@ -14,17 +15,30 @@ class AgentRegistry:
     def __init__(self):
         self.manifests: Dict[str, AgentManifest] = {}
         self._agents: Dict[str, BaseAgent] = {}
+        # Agency prefix (before the first '.') -> agent ids, so
+        # per-agency lookups avoid scanning the whole registry
+        self._by_agency: Dict[str, list[str]] = defaultdict(list)
 
     def load_from_directory(self, prompts_dir: Path) -> None:
-        """Load all agents from prompts directory."""
+        """Load all agents from prompts directory.
+
+        Registers the whole batch with two dict.update calls instead of
+        one register_agent call per manifest - the per-item insert and
+        index bookkeeping run in C.
+        """
         agents = discover_agents(prompts_dir)
 
-        for manifest, prompt_text in agents:
-            self.manifests[manifest.id] = manifest
-            self._agents[manifest.id] = BaseAgent(manifest, prompt_text)
+        seen = self._agents
+        new_ids = [m.id for m, _ in agents if m.id not in seen]
+        self.manifests.update((m.id, m) for m, _ in agents)
+        self._agents.update((m.id, BaseAgent(m, p)) for m, p in agents)
+        for agent_id in new_ids:
+            self._by_agency[agent_id.split(".", 1)[0]].append(agent_id)
 
     def register_agent(self, manifest: AgentManifest, prompt_text: str) -> None:
         """Register an agent manually."""
+        if manifest.id not in self._agents:
+            self._by_agency[manifest.id.split(".", 1)[0]].append(manifest.id)
         self.manifests[manifest.id] = manifest
         self._agents[manifest.id] = BaseAgent(manifest, prompt_text)
 
@@ -35,9 +49,7 @@ class AgentRegistry:
     def get_agents_by_agency(self, agency_id: str) -> list[BaseAgent]:
         """Get all agents for an agency."""
         return [
-            agent
-            for agent_id, agent in self._agents.items()
-            if agent_id.startswith(f"{agency_id}.")
+            self._agents[agent_id] for agent_id in self._by_agency.get(agency_id, ())
         ]
 
     def get_always_on_agents(self) -> list[str]:
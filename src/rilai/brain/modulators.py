@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalModulators:
     """System-wide affective state inferred from specific agents.
 
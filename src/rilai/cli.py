@@ -22,6 +22,16 @@ logger = logging.getLogger(__name__)
 
 def cmd_tui() -> int:
     """Launch the interactive TUI (default command)."""
+    # uvloop roughly halves coroutine scheduling overhead; the TUI is
+    # many small wakeups per tick, so use it when installed (pip install
+    # rilai[fast]) and fall back to stdlib asyncio otherwise
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     from rilai.ui import RilaiApp
 
     app = RilaiApp()
@@ -68,6 +78,22 @@ def cmd_shell(args: argparse.Namespace) -> int:
                 time_ms = event.payload.get("total_time_ms", 0)
                 print(f"\n[Completed in {time_ms}ms]")
 
+    def show_help() -> None:
+        print("\nCommands:")
+        print("  /help   - Show this help")
+        print("  /status - Show session status")
+        print("  exit    - Exit the shell")
+
+    def show_status() -> None:
+        print(f"\nSession: {session_id}")
+        print(f"Turn: {turn_runner.turn_id}")
+
+    # Slash-command dispatch - one dict lookup instead of an if-chain
+    commands = {
+        "/help": show_help,
+        "/status": show_status,
+    }
+
     async def shell_loop() -> None:
         """Main shell loop."""
         while True:
@@ -81,16 +107,9 @@ def cmd_shell(args: argparse.Namespace) -> int:
                     print("Goodbye!")
                     break
 
-                if user_input == "/help":
-                    print("\nCommands:")
-                    print("  /help   - Show this help")
-                    print("  /status - Show session status")
-                    print("  exit    - Exit the shell")
-                    continue
-
-                if user_input == "/status":
-                    print(f"\nSession: {session_id}")
-                    print(f"Turn: {turn_runner.turn_id}")
+                handler = commands.get(user_input)
+                if handler is not None:
+                    handler()
                     continue
 
                 await process_input(user_input)
@@ -32,16 +32,23 @@ class Claim(BaseModel):
     source_agent: str = Field(description="Agent that made this claim")
     urgency: int = Field(ge=0, le=3, description="0=background, 3=must act now")
     confidence: int = Field(ge=0, le=3, description="0=uncertain, 3=certain")
-    supports: list[str] = Field(
-        default_factory=list,
+    # Tuples freeze the default at class creation - the empty common
+    # case shares one object instead of calling a factory per claim
+    supports: tuple[str, ...] = Field(
+        default=(),
         description="IDs of claims this supports"
     )
-    opposes: list[str] = Field(
-        default_factory=list,
+    opposes: tuple[str, ...] = Field(
+        default=(),
         description="IDs of claims this opposes"
     )
 
 
+# Interned quiet outputs, one per agent_id (see AgentOutput.quiet);
+# bounded by the agent roster, so no eviction needed
+_QUIET_CACHE: dict[str, "AgentOutput"] = {}
+
+
 class AgentOutput(BaseModel):
     """Structured output from an agent.
 
@@ -59,8 +66,8 @@ class AgentOutput(BaseModel):
     )
     urgency: int = Field(ge=0, le=3, description="0=background, 3=must act now")
     confidence: int = Field(ge=0, le=3, description="0=uncertain, 3=certain")
-    claims: list[Claim] = Field(
-        default_factory=list,
+    claims: tuple[Claim, ...] = Field(
+        default=(),
         description="Atomic claims for deliberation"
     )
     stance_delta: dict[str, float] | None = Field(
@@ -86,15 +93,24 @@ class AgentOutput(BaseModel):
 
     @classmethod
     def quiet(cls, agent_id: str) -> AgentOutput:
-        """Create a 'quiet' output when agent has nothing to say."""
-        return cls(
-            agent_id=agent_id,
-            observation="Quiet",
-            salience=0.0,
-            urgency=0,
-            confidence=0,
-            claims=[],
-        )
+        """Return the 'quiet' output for an agent with nothing to say.
+
+        Instances are interned per agent_id - most agents are quiet on
+        most turns, so this turns the common path into a dict hit
+        instead of a model construction. Callers must treat the result
+        as immutable.
+        """
+        output = _QUIET_CACHE.get(agent_id)
+        if output is None:
+            output = cls(
+                agent_id=agent_id,
+                observation="Quiet",
+                salience=0.0,
+                urgency=0,
+                confidence=0,
+            )
+            _QUIET_CACHE[agent_id] = output
+        return output
 
 
 class AgentPriority(str, Enum):
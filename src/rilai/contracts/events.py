@@ -1,11 +1,10 @@
 """Event definitions - the backbone of v3 event sourcing."""
 
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 
 class EventKind(str, Enum):
     """All event kinds in the system.
@@ -94,11 +93,12 @@ class EventKind(str, Enum):
     ERROR = "error"
 
 
-class EngineEvent(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EngineEvent:
     """Immutable event envelope - the atomic unit of the system.
 
     Every event has:
-    - session_id: Which session this belongs to
+    - session_id: Which session this belongs to (UUID)
     - turn_id: Which turn (0 for daemon events)
     - seq: Monotonically increasing within turn
     - ts_monotonic: time.monotonic() for duration calculations
@@ -109,24 +109,21 @@ class EngineEvent(BaseModel):
 
     Events are immutable once created (frozen=True).
     Events are ordered by (session_id, turn_id, seq).
+
+    A slotted dataclass rather than a Pydantic model: thousands of events
+    flow through per session, all constructed internally from trusted
+    code paths, so validation overhead and a per-instance __dict__ buy
+    nothing here.
     """
 
-    session_id: str = Field(description="Session identifier (UUID)")
-    turn_id: int = Field(ge=0, description="Turn number (0 for daemon events)")
-    seq: int = Field(ge=0, description="Sequence number within turn")
-    ts_monotonic: float = Field(description="time.monotonic() timestamp")
-    ts_wall: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="Wall clock timestamp"
-    )
-    kind: EventKind = Field(description="Event type")
-    payload: dict[str, Any] = Field(
-        default_factory=dict,
-        description="Event-specific data"
-    )
-    schema_version: int = Field(default=1, description="Schema version for migrations")
-
-    model_config = {"frozen": True}
+    session_id: str
+    turn_id: int
+    seq: int
+    ts_monotonic: float
+    ts_wall: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    kind: EventKind
+    payload: dict[str, Any] = field(default_factory=dict)
+    schema_version: int = 1
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -138,16 +138,32 @@ class GlobalModulators(BaseModel):
         """Decay all modulators toward baseline.
 
         Returns True if any modulator changed significantly.
+
+        Unrolled over the four fields: the daemon calls this every
+        tick, and straight attribute arithmetic beats the former
+        getattr/setattr loop with its per-name string compare. The
+        change test uses the closed form - the delta from one decay
+        step is (current - target) * (1 - factor).
         """
-        changed = False
-        for name in ["arousal", "fatigue", "time_pressure", "social_risk"]:
-            current = getattr(self, name)
-            target = baseline if name == "arousal" else 0.0
-            new_value = target + (current - target) * factor
-            if abs(new_value - current) > 0.01:
-                changed = True
-            object.__setattr__(self, name, new_value)
-        object.__setattr__(self, "last_update", datetime.now())
+        arousal = self.arousal
+        fatigue = self.fatigue
+        time_pressure = self.time_pressure
+        social_risk = self.social_risk
+
+        drift = 1.0 - factor
+        changed = (
+            abs(arousal - baseline) * drift > 0.01
+            or fatigue * drift > 0.01
+            or time_pressure * drift > 0.01
+            or social_risk * drift > 0.01
+        )
+
+        set_field = object.__setattr__
+        set_field(self, "arousal", baseline + (arousal - baseline) * factor)
+        set_field(self, "fatigue", fatigue * factor)
+        set_field(self, "time_pressure", time_pressure * factor)
+        set_field(self, "social_risk", social_risk * factor)
+        set_field(self, "last_update", datetime.now())
         return changed
 
     def to_dict(self) -> dict[str, float]:
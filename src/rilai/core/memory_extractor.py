@@ -6,6 +6,11 @@ Extracts memory summary from the Store for display in the TUI memory panel.
 from rilai.observability import Store
 
 
+def _brief(text: str, limit: int = 50) -> str:
+    """Truncate text with an ellipsis for panel display."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 def extract_memory(store: Store) -> dict:
     """Extract memory summary for TUI panel.
 
@@ -63,16 +68,18 @@ def _extract_evidence(messages: list[dict]) -> list[dict]:
     # Look for patterns in recent messages
     for i, msg in enumerate(messages[-5:]):  # Last 5 messages
         content = msg.get("content", "")
+        content_lower = content.lower()
         role = msg.get("role", "")
+        brief = _brief(content)
 
         if role == "user":
             # Look for emotional content
             emotion_words = ["feel", "feeling", "happy", "sad", "angry", "anxious", "stressed"]
-            if any(w in content.lower() for w in emotion_words):
+            if any(w in content_lower for w in emotion_words):
                 evidence.append({
                     "type": "emotional_expression",
                     "source": f"message_{i}",
-                    "brief": content[:50] + "..." if len(content) > 50 else content,
+                    "brief": brief,
                 })
 
             # Look for questions
@@ -80,16 +87,16 @@ def _extract_evidence(messages: list[dict]) -> list[dict]:
                 evidence.append({
                     "type": "question",
                     "source": f"message_{i}",
-                    "brief": content[:50] + "..." if len(content) > 50 else content,
+                    "brief": brief,
                 })
 
             # Look for goal/planning language
             planning_words = ["want to", "need to", "plan to", "going to", "should"]
-            if any(w in content.lower() for w in planning_words):
+            if any(w in content_lower for w in planning_words):
                 evidence.append({
                     "type": "goal_expression",
                     "source": f"message_{i}",
-                    "brief": content[:50] + "..." if len(content) > 50 else content,
+                    "brief": brief,
                 })
 
     # Limit to 5 evidence items for display
@@ -23,7 +23,7 @@ def clamp01(value: float) -> float:
     return clamp(value, 0.0, 1.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class StanceVector:
     """
     Persistent affective control state - NOT a claim of human emotion.
@@ -11,6 +11,8 @@ through reentrant conditioning.
 Extended with AmbientContext for ambient cognitive processing mode.
 """
 
+import heapq
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -18,6 +20,12 @@ from typing import Literal, Optional
 
 from rilai.core.stance import StanceVector
 
+# All 5 possible 4-cell probability bars, built once at import
+_SENSOR_BARS = tuple("▓" * i + "░" * (4 - i) for i in range(5))
+
+# %-template for the per-sensor prompt line (C-level formatting path)
+_SENSOR_LINE = "  %s: %s %.2f"
+
 
 class InteractionGoal(Enum):
     """
@@ -192,7 +200,9 @@ class AmbientContext:
 
     # Stakes tracking
     current_stakes: float = 0.0
-    stakes_history: list[tuple[datetime, float]] = field(default_factory=list)
+    stakes_history: deque[tuple[datetime, float]] = field(
+        default_factory=lambda: deque(maxlen=10)
+    )
     stakes_trend: Literal["rising", "stable", "falling"] = "stable"
 
     # Open loops
@@ -220,7 +230,7 @@ class AmbientContext:
             "episode_summary": self.episode_summary,
             "current_stakes": self.current_stakes,
             "stakes_history": [
-                (ts.isoformat(), stakes) for ts, stakes in self.stakes_history[-10:]
+                (ts.isoformat(), stakes) for ts, stakes in self.stakes_history
             ],
             "stakes_trend": self.stakes_trend,
             "active_commitments": [c.to_dict() for c in self.active_commitments],
@@ -244,15 +254,12 @@ class AmbientContext:
     def update_stakes(self, stakes: float) -> None:
         """Update stakes and compute trend."""
         now = datetime.now()
+        # deque(maxlen=10) evicts the oldest entry in O(1) - no reslice
         self.stakes_history.append((now, stakes))
 
-        # Keep last 10 entries
-        if len(self.stakes_history) > 10:
-            self.stakes_history = self.stakes_history[-10:]
-
         # Compute trend
         if len(self.stakes_history) >= 3:
-            recent = [s for _, s in self.stakes_history[-3:]]
+            recent = [s for _, s in list(self.stakes_history)[-3:]]
             if recent[-1] > recent[0] + 0.1:
                 self.stakes_trend = "rising"
             elif recent[-1] < recent[0] - 0.1:
@@ -406,8 +413,8 @@ class WorkspacePacket:
             "Sensors:",
         ])
         for sensor, prob in sorted(self.sensor_summary.items(), key=lambda x: -x[1]):
-            bar = "▓" * int(prob * 4) + "░" * (4 - int(prob * 4))
-            lines.append(f"  {sensor}: {bar} {prob:.2f}")
+            bar = _SENSOR_BARS[max(0, min(4, int(prob * 4)))]
+            lines.append(_SENSOR_LINE % (sensor, bar, prob))
 
         lines.extend([
             "",
@@ -420,13 +427,13 @@ class WorkspacePacket:
 
         if self.micro_agent_highlights:
             lines.extend(["", "Agent Glimpses:"])
-            for h in sorted(self.micro_agent_highlights, key=lambda x: -x.salience)[:5]:
+            for h in heapq.nlargest(5, self.micro_agent_highlights, key=lambda x: x.salience):
                 if h.glimpse:
                     lines.append(f"  [{h.agent}] {h.glimpse}")
 
         if self.collected_questions:
             lines.extend(["", "Top Questions:"])
-            for q in sorted(self.collected_questions, key=lambda x: -x.priority)[:3]:
+            for q in heapq.nlargest(3, self.collected_questions, key=lambda x: x.priority):
                 lines.append(f"  - {q.question}")
 
         if self.relationship_summary and self.relationship_summary.summary:
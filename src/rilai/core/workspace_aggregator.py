@@ -88,6 +88,7 @@ def _extract_primary_question(collected: CollectedAssessments) -> str:
 
     for agent in top_agents:
         output = agent.voice
+        output_lower = output.lower()
 
         # Look for explicit question markers
         if "?" in output:
@@ -105,11 +106,11 @@ def _extract_primary_question(collected: CollectedAssessments) -> str:
                         return question[:100]  # Truncate for display
 
         # Look for "wondering" or similar patterns
-        if "wondering" in output.lower() or "curious" in output.lower():
+        if "wondering" in output_lower or "curious" in output_lower:
             # Extract the relevant part
             for phrase in ["wondering if", "wondering about", "curious about", "curious whether"]:
-                if phrase in output.lower():
-                    idx = output.lower().index(phrase)
+                if phrase in output_lower:
+                    idx = output_lower.index(phrase)
                     snippet = output[idx:idx + 80]
                     # Clean up
                     if "." in snippet:
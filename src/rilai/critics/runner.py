@@ -24,9 +24,9 @@ PROMPTS_DIR = Path(__file__).parent / "prompts"
 def load_critic_prompt(critic_name: str) -> str:
     """Load the prompt template for a critic."""
     prompt_path = PROMPTS_DIR / f"{critic_name}.md"
-    if prompt_path.exists():
+    try:
         return prompt_path.read_text()
-    else:
+    except FileNotFoundError:
         return _get_generic_critic_prompt(critic_name)
 
 
@@ -1,7 +1,9 @@
 """Brain Daemon - background tick loop for proactive behavior."""
 
 import asyncio
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Callable, Optional, Any, TYPE_CHECKING
 
@@ -11,6 +13,8 @@ from rilai.store.event_log import EventLogWriter
 if TYPE_CHECKING:
     from rilai.runtime.workspace import Workspace
 
+logger = logging.getLogger(__name__)
+
 
 class BrainDaemon:
     """Background daemon for proactive behavior.
@@ -49,6 +53,7 @@ class BrainDaemon:
         self._task: Optional[asyncio.Task] = None
         self._seq = 0
         self._tick_count = 0
+        self._io_pool: Optional[ThreadPoolExecutor] = None
 
         # Initialize helpers
         from rilai.daemon.nudges import NudgeChecker
@@ -58,7 +63,12 @@ class BrainDaemon:
         self.decay = ModulatorDecay(workspace)
 
     def _emit(self, kind: EventKind, payload: dict) -> EngineEvent:
-        """Create and persist a daemon event."""
+        """Create and persist a daemon event.
+
+        While the tick loop is running, the SQLite write happens on the
+        daemon's single-worker thread pool so it never blocks the UI
+        event loop; the single worker preserves append order.
+        """
         self._seq += 1
         event = EngineEvent(
             session_id=self.session_id,
@@ -68,9 +78,25 @@ class BrainDaemon:
             kind=kind,
             payload=payload,
         )
-        self.event_log.append(event)
+        if self._io_pool is not None:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._io_pool, self.event_log.append, event
+            )
+            # Don't drop the future on the floor - a failed append
+            # would otherwise vanish silently
+            future.add_done_callback(self._log_append_result)
+        else:
+            self.event_log.append(event)
         return event
 
+    @staticmethod
+    def _log_append_result(future: asyncio.Future) -> None:
+        """Surface errors from off-loop event log appends."""
+        if not future.cancelled():
+            exc = future.exception()
+            if exc is not None:
+                logger.error("Daemon event append failed: %s", exc)
+
     async def start(self, session_id: str) -> None:
         """Start the background tick loop.
 
@@ -83,6 +109,9 @@ class BrainDaemon:
         self.session_id = session_id
         self._running = True
         self._tick_count = 0
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="brain-daemon"
+        )
         self._task = asyncio.create_task(self._tick_loop())
 
     async def stop(self) -> None:
@@ -95,6 +124,9 @@ class BrainDaemon:
             except asyncio.CancelledError:
                 pass
             self._task = None
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
 
     async def _tick_loop(self) -> None:
         """Main daemon loop."""
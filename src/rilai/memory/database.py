@@ -517,49 +517,63 @@ class Database:
 
     def get_stats(self, hours: int = 24) -> dict[str, Any]:
         """Get statistics for the last N hours."""
-        cutoff = datetime.now().isoformat()[:10]  # Just use date for simplicity
-
         with self._connection() as conn:
-            # Count turns
-            turns = conn.execute(
-                "SELECT COUNT(*) as count FROM turns WHERE created_at > ?",
-                (cutoff,),
-            ).fetchone()["count"]
-
-            # Count agent calls
-            agent_calls = conn.execute(
-                "SELECT COUNT(*) as count FROM agent_calls WHERE created_at > ?",
-                (cutoff,),
-            ).fetchone()["count"]
-
-            # Sum tokens
-            tokens = conn.execute(
-                """SELECT
-                    COALESCE(SUM(prompt_tokens), 0) as prompt,
-                    COALESCE(SUM(completion_tokens), 0) as completion,
-                    COALESCE(SUM(reasoning_tokens), 0) as reasoning
-                FROM model_calls WHERE created_at > ?""",
-                (cutoff,),
-            ).fetchone()
+            return self._query_stats(conn, hours)
 
-            # Average turn time
-            avg_time = conn.execute(
-                """SELECT AVG(total_time_ms) as avg_ms
-                FROM turns WHERE created_at > ?""",
-                (cutoff,),
-            ).fetchone()["avg_ms"] or 0
+    def _query_stats(self, conn: sqlite3.Connection, hours: int) -> dict[str, Any]:
+        """Run the aggregate-stats queries on an existing connection."""
+        cutoff = datetime.now().isoformat()[:10]  # Just use date for simplicity
 
-            return {
-                "turns": turns,
-                "agent_calls": agent_calls,
-                "prompt_tokens": tokens["prompt"],
-                "completion_tokens": tokens["completion"],
-                "reasoning_tokens": tokens["reasoning"],
-                "avg_turn_time_ms": round(avg_time, 1),
-            }
+        # Count turns
+        turns = conn.execute(
+            "SELECT COUNT(*) as count FROM turns WHERE created_at > ?",
+            (cutoff,),
+        ).fetchone()["count"]
+
+        # Count agent calls
+        agent_calls = conn.execute(
+            "SELECT COUNT(*) as count FROM agent_calls WHERE created_at > ?",
+            (cutoff,),
+        ).fetchone()["count"]
+
+        # Sum tokens
+        tokens = conn.execute(
+            """SELECT
+                COALESCE(SUM(prompt_tokens), 0) as prompt,
+                COALESCE(SUM(completion_tokens), 0) as completion,
+                COALESCE(SUM(reasoning_tokens), 0) as reasoning
+            FROM model_calls WHERE created_at > ?""",
+            (cutoff,),
+        ).fetchone()
+
+        # Average turn time
+        avg_time = conn.execute(
+            """SELECT AVG(total_time_ms) as avg_ms
+            FROM turns WHERE created_at > ?""",
+            (cutoff,),
+        ).fetchone()["avg_ms"] or 0
+
+        return {
+            "turns": turns,
+            "agent_calls": agent_calls,
+            "prompt_tokens": tokens["prompt"],
+            "completion_tokens": tokens["completion"],
+            "reasoning_tokens": tokens["reasoning"],
+            "avg_turn_time_ms": round(avg_time, 1),
+        }
 
     def get_agent_stats(self, agent_id: str | None = None, limit: int = 20) -> list[dict]:
         """Get per-agent statistics."""
+        with self._connection() as conn:
+            return self._query_agent_stats(conn, agent_id, limit)
+
+    def _query_agent_stats(
+        self,
+        conn: sqlite3.Connection,
+        agent_id: str | None,
+        limit: int,
+    ) -> list[dict]:
+        """Run the per-agent stats query on an existing connection."""
         query = """
             SELECT
                 agent_id,
@@ -578,6 +592,19 @@ class Database:
         query += " GROUP BY agent_id ORDER BY call_count DESC LIMIT ?"
         params.append(limit)
 
+        rows = conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_dashboard_stats(
+        self, hours: int = 24, top_agents: int = 5
+    ) -> dict[str, Any]:
+        """Get aggregate and per-agent stats in one connection round-trip.
+
+        Replaces the get_stats + get_agent_stats pair that stats views
+        previously issued as two separate connection acquisitions.
+        """
         with self._connection() as conn:
-            rows = conn.execute(query, params).fetchall()
-            return [dict(row) for row in rows]
+            return {
+                "stats": self._query_stats(conn, hours),
+                "agents": self._query_agent_stats(conn, None, top_agents),
+            }
@@ -8,7 +8,7 @@ import json
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from rilai.config import get_config
 
@@ -79,6 +79,10 @@ class ShortTermMemory:
         self.turns_dir = self.current_dir / "turns"
         self.agents_dir = self.current_dir / "agents"
 
+        # In-memory mirror of messages.json (None = not loaded yet).
+        # We are the only writer, so re-reading the file per call is waste.
+        self._messages_cache: list[dict] | None = None
+
         self._ensure_dirs()
 
     def _ensure_dirs(self) -> None:
@@ -89,10 +93,11 @@ class ShortTermMemory:
 
     def _read_json(self, path: Path) -> dict | list | None:
         """Read JSON file, return None if not exists."""
-        if not path.exists():
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
             return None
-        with open(path) as f:
-            return json.load(f)
 
     def _write_json(self, path: Path, data: Any) -> None:
         """Write data to JSON file."""
@@ -110,6 +115,7 @@ class ShortTermMemory:
         )
         self._write_json(self.current_dir / "session.json", asdict(session))
         self._write_json(self.current_dir / "messages.json", [])
+        self._messages_cache = []
         return session
 
     def get_session(self) -> SessionData | None:
@@ -131,6 +137,14 @@ class ShortTermMemory:
 
     # Message operations
 
+    def _read_messages(self) -> list[dict]:
+        """Get the message list, loading from disk only on first access."""
+        if self._messages_cache is None:
+            self._messages_cache = (
+                self._read_json(self.current_dir / "messages.json") or []
+            )
+        return self._messages_cache
+
     def add_message(
         self,
         role: str,
@@ -149,7 +163,7 @@ class ShortTermMemory:
             metadata=metadata or {},
         )
 
-        messages = self._read_json(self.current_dir / "messages.json") or []
+        messages = self._read_messages()
         messages.append(asdict(message))
         self._write_json(self.current_dir / "messages.json", messages)
 
@@ -157,14 +171,14 @@ class ShortTermMemory:
 
     def get_messages(self, limit: int | None = None) -> list[StoredMessage]:
         """Get conversation messages."""
-        messages = self._read_json(self.current_dir / "messages.json") or []
+        messages = self._read_messages()
         if limit is not None:
             messages = messages[-limit:]
         return [StoredMessage(**m) for m in messages]
 
     def get_messages_as_dicts(self, limit: int | None = None) -> list[dict]:
         """Get messages as simple dicts for LLM context."""
-        messages = self._read_json(self.current_dir / "messages.json") or []
+        messages = self._read_messages()
         if limit is not None:
             messages = messages[-limit:]
         return [{"role": m["role"], "content": m["content"]} for m in messages]
@@ -249,6 +263,7 @@ class ShortTermMemory:
 
         if self.current_dir.exists():
             shutil.rmtree(self.current_dir)
+        self._messages_cache = None
         self._ensure_dirs()
 
     def clear_all(self) -> None:
@@ -261,6 +276,7 @@ class ShortTermMemory:
                     shutil.rmtree(item)
                 elif item.is_file() and item.suffix == ".json":
                     item.unlink()
+        self._messages_cache = None
         self._ensure_dirs()
 
     # Export operations
@@ -269,20 +285,25 @@ class ShortTermMemory:
         """Export current conversation for backup."""
         return {
             "session": asdict(self.get_session()) if self.get_session() else None,
-            "messages": self._read_json(self.current_dir / "messages.json") or [],
+            "messages": self._read_messages(),
             "exported_at": datetime.now().isoformat(),
         }
 
-    def export_to_markdown(self) -> str:
-        """Export conversation as markdown."""
-        messages = self.get_messages()
-        lines = ["# Conversation Export\n"]
-        lines.append(f"Exported: {datetime.now().isoformat()}\n")
+    def export_markdown_iter(self) -> Iterator[str]:
+        """Yield the markdown export one fragment at a time.
 
-        for msg in messages:
+        Lets callers that only need a preview stop early instead of
+        paying for the full conversation render.
+        """
+        yield "# Conversation Export\n"
+        yield f"Exported: {datetime.now().isoformat()}\n"
+
+        for msg in self.get_messages():
             role = msg.role.capitalize()
-            lines.append(f"## {role}\n")
-            lines.append(f"*{msg.timestamp}*\n")
-            lines.append(f"{msg.content}\n")
+            yield f"## {role}\n"
+            yield f"*{msg.timestamp}*\n"
+            yield f"{msg.content}\n"
 
-        return "\n".join(lines)
+    def export_to_markdown(self) -> str:
+        """Export conversation as markdown."""
+        return "\n".join(self.export_markdown_iter())
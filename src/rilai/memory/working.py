@@ -4,6 +4,7 @@ Working memory holds information relevant to the current turn,
 including conversation context, active goals, and recent assessments.
 """
 
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -262,21 +263,21 @@ class WorkingMemory:
         if len(self._items) <= self.max_items:
             return
 
-        # Sort by relevance and keep top items
-        self._items = sorted(
-            self._items, key=lambda x: x.relevance, reverse=True
-        )[: self.max_items]
+        # Keep the top items by relevance; nlargest is O(n log k)
+        self._items = heapq.nlargest(
+            self.max_items, self._items, key=lambda x: x.relevance
+        )
 
     def _prune_goals(self) -> None:
         """Remove lowest priority goals to stay under limit."""
         if len(self._goals) <= self.max_goals:
             return
 
-        # Sort by priority and keep top goals
-        sorted_goals = sorted(
-            self._goals.values(), key=lambda x: x.priority, reverse=True
+        # Keep the top goals by priority
+        top_goals = heapq.nlargest(
+            self.max_goals, self._goals.values(), key=lambda x: x.priority
         )
-        self._goals = {g.goal_id: g for g in sorted_goals[: self.max_goals]}
+        self._goals = {g.goal_id: g for g in top_goals}
 
     def to_context_dict(self) -> dict[str, Any]:
         """Export working memory as a context dict for agents.
@@ -71,8 +71,8 @@ def query_stats(hours: int = 24, output_format: str = "table") -> str:
         Formatted output string
     """
     store = get_store()
-    stats = store.get_stats(hours)
-    agent_stats = store.get_agent_stats(limit=10)
+    bundle = store.get_dashboard_stats(hours=hours, top_agents=10)
+    stats, agent_stats = bundle["stats"], bundle["agents"]
 
     if output_format == "json":
         return json.dumps({"stats": stats, "agent_stats": agent_stats}, indent=2)
@@ -8,7 +8,7 @@ import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from rilai.config import get_config
 from rilai.memory.database import Database
@@ -333,6 +333,14 @@ class Store:
             return self.db.get_agent_stats(agent_id, limit)
         return []
 
+    def get_dashboard_stats(
+        self, hours: int = 24, top_agents: int = 5
+    ) -> dict[str, Any]:
+        """Get aggregate and per-agent stats in a single DB round-trip."""
+        if self.db:
+            return self.db.get_dashboard_stats(hours, top_agents)
+        return {"stats": {}, "agents": []}
+
     def get_recent_agent_calls(
         self, agent_id: str | None = None, limit: int = 20
     ) -> list[dict]:
@@ -379,6 +387,15 @@ class Store:
             return self.stm.export_to_markdown()
         return ""
 
+    def export_markdown_iter(self) -> Iterator[str]:
+        """Stream the markdown export fragment by fragment.
+
+        Preferred over export_markdown when only a bounded preview is
+        needed - callers can stop consuming once they have enough.
+        """
+        if self.stm:
+            yield from self.stm.export_markdown_iter()
+
 
 # Global store instance (initialized lazily)
 _store: Store | None = None
@@ -2,6 +2,7 @@
 
 from typing import Callable, TYPE_CHECKING
 
+from rilai.config import get_config
 from rilai.contracts.events import EngineEvent, EventKind
 from rilai.contracts.council import CouncilDecision, SpeechAct, ResponseUrgency
 from rilai.contracts.agent import Claim, ClaimType
@@ -147,7 +148,6 @@ class Council:
 
         try:
             from rilai.providers.openrouter import get_provider, Message
-            from rilai.config import get_config
 
             provider = get_provider()
             config = get_config()
@@ -51,9 +51,11 @@ def _add_claim(workspace: "Workspace", claim: Claim) -> None:
     # Check for duplicate by text similarity
     for existing in workspace.active_claims:
         if _claims_similar(existing, claim):
-            # Merge supports/opposes
-            existing.supports = list(set(existing.supports + claim.supports))
-            existing.opposes = list(set(existing.opposes + claim.opposes))
+            # Merge supports/opposes; stay in tuples - the fields are
+            # tuple-typed and assignment skips validation, so a list
+            # here would break the next merge of the same claim
+            existing.supports = tuple(set(existing.supports) | set(claim.supports))
+            existing.opposes = tuple(set(existing.opposes) | set(claim.opposes))
             # Update urgency/confidence to max
             existing.urgency = max(existing.urgency, claim.urgency)
             existing.confidence = max(existing.confidence, claim.confidence)
@@ -93,7 +95,9 @@ def _apply_stance_delta(
     alpha = 0.25  # Integration rate
 
     for dim, change in delta.items():
-        if dim not in STANCE_BOUNDS:
+        # Agents commonly emit zero deltas for dimensions they leave
+        # alone - skip the integrate/clamp/setattr work entirely
+        if not change or dim not in STANCE_BOUNDS:
             continue
 
         # Clamp delta
@@ -1,6 +1,7 @@
 """TurnRunner - orchestrates a single turn, yielding ordered events."""
 
 import time
+from datetime import datetime, timedelta, timezone
 from typing import AsyncIterator, TYPE_CHECKING
 
 from rilai.contracts.events import EngineEvent, EventKind
@@ -30,6 +31,7 @@ class TurnRunner:
         self.session_id: str = ""
         self.turn_id: int = 0
         self._start_monotonic: float = 0.0
+        self._start_wall: datetime | None = None
 
     def set_session(self, session_id: str) -> None:
         """Set the current session ID."""
@@ -38,11 +40,21 @@ class TurnRunner:
 
     def _emit(self, kind: EventKind, payload: dict) -> EngineEvent:
         """Create, persist, and return an event."""
+        ts_monotonic = time.monotonic()
+        # Derive wall time from the per-turn anchor instead of calling
+        # datetime.now() for every event in the burst
+        if self._start_wall is not None:
+            ts_wall = self._start_wall + timedelta(
+                seconds=ts_monotonic - self._start_monotonic
+            )
+        else:
+            ts_wall = datetime.now(timezone.utc)
         event = EngineEvent(
             session_id=self.session_id,
             turn_id=self.turn_id,
             seq=self.event_log.next_seq(self.session_id, self.turn_id),
-            ts_monotonic=time.monotonic(),
+            ts_monotonic=ts_monotonic,
+            ts_wall=ts_wall,
             kind=kind,
             payload=payload,
         )
@@ -62,6 +74,7 @@ class TurnRunner:
         """
         self.turn_id += 1
         self._start_monotonic = time.monotonic()
+        self._start_wall = datetime.now(timezone.utc)
 
         # ─────────────────────────────────────────────────────────────────
         # Stage 0: Ingest & Normalize
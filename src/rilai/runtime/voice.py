@@ -2,6 +2,7 @@
 
 from typing import Callable, AsyncIterator, TYPE_CHECKING
 
+from rilai.config import get_config
 from rilai.contracts.events import EngineEvent, EventKind
 from rilai.contracts.council import CouncilDecision, VoiceResult
 
@@ -59,7 +60,6 @@ class Voice:
                 )
 
         # Get model from config
-        from rilai.config import get_config
         from rilai.providers.openrouter import Message
         config = get_config()
         model = config.MODELS.get("medium", config.MODELS.get("small"))
@@ -207,7 +207,6 @@ IMPORTANT:
                 return
 
         # Get model from config
-        from rilai.config import get_config
         from rilai.providers.openrouter import Message
         config = get_config()
         model = config.MODELS.get("medium", config.MODELS.get("small"))
@@ -24,9 +24,9 @@ PROMPTS_DIR = Path(__file__).parent / "prompts"
 def load_sensor_prompt(sensor_name: str) -> str:
     """Load the prompt template for a sensor."""
     prompt_path = PROMPTS_DIR / f"{sensor_name}.md"
-    if prompt_path.exists():
+    try:
         return prompt_path.read_text()
-    else:
+    except FileNotFoundError:
         # Fallback to generic template
         return _get_generic_sensor_prompt(sensor_name)
 
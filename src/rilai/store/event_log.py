@@ -9,6 +9,20 @@ from typing import Iterator
 
 from rilai.contracts.events import EngineEvent, EventKind
 
+# orjson's C encoder is several times faster on the small payload dicts
+# that flow through here per event; optional (pip install rilai[fast]).
+# The payload column is TEXT, so decode orjson's bytes back to str.
+try:
+    import orjson
+
+    def _payload_dumps(payload: dict) -> str:
+        return orjson.dumps(payload).decode()
+
+    _payload_loads = orjson.loads
+except ImportError:
+    _payload_dumps = json.dumps
+    _payload_loads = json.loads
+
 
 class EventLogWriter:
     """Single-writer append-only event log.
@@ -155,7 +169,7 @@ class EventLogWriter:
                     event.ts_monotonic,
                     event.ts_wall.isoformat(),
                     event.kind.value,
-                    json.dumps(event.payload),
+                    _payload_dumps(event.payload),
                     event.schema_version,
                 ),
             )
@@ -178,7 +192,7 @@ class EventLogWriter:
                         e.ts_monotonic,
                         e.ts_wall.isoformat(),
                         e.kind.value,
-                        json.dumps(e.payload),
+                        _payload_dumps(e.payload),
                         e.schema_version,
                     )
                     for e in events
@@ -218,7 +232,7 @@ class EventLogWriter:
                     ts_monotonic=row["ts_monotonic"],
                     ts_wall=datetime.fromisoformat(row["ts_wall"]),
                     kind=EventKind(row["kind"]),
-                    payload=json.loads(row["payload_json"]),
+                    payload=_payload_loads(row["payload_json"]),
                     schema_version=row["schema_version"],
                 )
 
@@ -247,7 +261,7 @@ class EventLogWriter:
                     ts_monotonic=row["ts_monotonic"],
                     ts_wall=datetime.fromisoformat(row["ts_wall"]),
                     kind=EventKind(row["kind"]),
-                    payload=json.loads(row["payload_json"]),
+                    payload=_payload_loads(row["payload_json"]),
                     schema_version=row["schema_version"],
                 )
 
@@ -280,7 +294,7 @@ class EventLogWriter:
                         ts_monotonic=row["ts_monotonic"],
                         ts_wall=datetime.fromisoformat(row["ts_wall"]),
                         kind=EventKind(row["kind"]),
-                        payload=json.loads(row["payload_json"]),
+                        payload=_payload_loads(row["payload_json"]),
                         schema_version=row["schema_version"],
                     )
                 )
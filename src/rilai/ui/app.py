@@ -1,14 +1,14 @@
 """Rilai v3 TUI Application - Event-driven terminal interface."""
 
 import asyncio
-import uuid
 from pathlib import Path
+from secrets import token_hex
 from typing import Callable
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
-from textual.widgets import Header, Footer, Input, TabbedContent, TabPane, Static
+from textual.widgets import Header, Footer, Input, TabbedContent, TabPane
 
 from rilai.ui.projection import TurnStateProjection, UIUpdate
 from rilai.ui.panels import (
@@ -23,6 +23,10 @@ from rilai.contracts.events import EngineEvent
 from rilai.store import EventLogWriter
 from rilai.runtime import TurnRunner, Workspace, Scheduler
 
+# Update kinds where only the latest payload matters - intermediate
+# snapshots within one event batch can be dropped (latest-wins)
+_COALESCE_KINDS = frozenset({"sensors", "stance", "critics", "activity"})
+
 
 class RilaiApp(App):
     """Rilai v3 TUI Application.
@@ -109,7 +113,7 @@ class RilaiApp(App):
         )
 
         # Session management
-        self.session_id = str(uuid.uuid4())[:8]
+        self.session_id = token_hex(4)
         self.turn_runner.set_session(self.session_id)
 
         # UI state projection
@@ -124,6 +128,18 @@ class RilaiApp(App):
         # Daemon reference (set in on_mount)
         self._daemon = None
 
+        # UIUpdate kind -> handler, built in on_mount (needs widgets mounted)
+        self._update_dispatch: dict[str, Callable[[dict], None]] = {}
+
+        # Slash command -> bound handler, built once
+        self._cmd_table: dict[str, Callable[[], None]] = {
+            "/help": self._cmd_help,
+            "/clear": self._cmd_clear,
+            "/status": self._cmd_status,
+            "/session": self._cmd_session,
+            "/reset": self._cmd_reset,
+        }
+
     def compose(self) -> ComposeResult:
         """Compose the application layout."""
         yield Header()
@@ -155,6 +171,24 @@ class RilaiApp(App):
         # Focus input
         self.query_one("#user-input", Input).focus()
 
+        # Resolve panels once - query_one walks the DOM on every call
+        self._chat_panel = self.query_one("#chat-panel", ChatPanel)
+        self._sensors_panel = self.query_one("#sensors-panel", SensorsPanel)
+        self._stance_panel = self.query_one("#stance-panel", StancePanel)
+        self._agents_panel = self.query_one("#agents-panel", AgentsPanel)
+        self._critics_panel = self.query_one("#critics-panel", CriticsPanel)
+        self._activity_panel = self.query_one("#activity-bar", ActivityPanel)
+
+        # Precompute update dispatch - avoids re-matching kind per update
+        self._update_dispatch = {
+            "chat": self._apply_chat,
+            "sensors": self._apply_sensors,
+            "stance": self._apply_stance,
+            "agents": self._apply_agents,
+            "critics": self._apply_critics,
+            "activity": self._apply_activity,
+        }
+
         # Start daemon if available
         try:
             from rilai.daemon import BrainDaemon
@@ -206,101 +240,149 @@ class RilaiApp(App):
             # Reset projection for new turn
             self.projection.reset_for_turn()
 
-            # Stream events from turn runner
-            async for event in self.turn_runner.run_turn(user_input):
-                await self._apply_event(event)
+            # Produce events into a bounded queue so the turn pipeline
+            # keeps running while the UI renders the previous event,
+            # instead of stalling the generator on every repaint
+            queue: asyncio.Queue[EngineEvent | None] = asyncio.Queue(maxsize=64)
+
+            async def _produce() -> None:
+                try:
+                    async for event in self.turn_runner.run_turn(user_input):
+                        await queue.put(event)
+                finally:
+                    # put_nowait: a full queue here means the consumer
+                    # is already dead, and an awaited put would wedge
+                    # TaskGroup exit while we are being cancelled
+                    try:
+                        queue.put_nowait(None)
+                    except asyncio.QueueFull:
+                        pass
+
+            async def _consume() -> None:
+                while (event := await queue.get()) is not None:
+                    self._apply_event(event)
+
+            # TaskGroup cancels the sibling when either side fails -
+            # with gather, a consumer error left the producer parked on
+            # queue.put with a half-finished turn generator
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(_produce())
+                tg.create_task(_consume())
 
         except Exception as e:
+            # TaskGroup wraps failures in an ExceptionGroup; unwrap the
+            # single-member case so the log and toast show the real
+            # error, not "unhandled errors in a TaskGroup"
+            if isinstance(e, ExceptionGroup) and len(e.exceptions) == 1:
+                e = e.exceptions[0]
             self.log.error(f"Turn error: {e}")
             self.notify(f"Error: {e}", severity="error")
 
         finally:
             self._processing = False
 
-    async def _apply_event(self, event: EngineEvent) -> None:
-        """Apply engine event to UI via projection."""
-        updates = self.projection.apply_event(event)
+    def _apply_event(self, event: EngineEvent) -> None:
+        """Apply engine event to UI via projection.
 
-        for update in updates:
-            await self._apply_update(update)
+        Updates from one event are coalesced: for snapshot-style kinds
+        only the last payload is applied, while ordered kinds (chat,
+        agents) keep every update.
+        """
+        batch: list[UIUpdate] = []
+        slots: dict[str, int] = {}
+        for update in self.projection.apply_event(event):
+            if update.kind in _COALESCE_KINDS:
+                slot = slots.get(update.kind)
+                if slot is not None:
+                    batch[slot] = update
+                    continue
+                slots[update.kind] = len(batch)
+            batch.append(update)
+
+        if not batch:
+            return
 
-    async def _apply_update(self, update: UIUpdate) -> None:
+        # One compositor pass per event, even when it fans out into
+        # several panel updates
+        with self.batch_update():
+            for update in batch:
+                self._apply_update(update)
+
+    def _apply_update(self, update: UIUpdate) -> None:
         """Apply a single UI update to widgets."""
-        match update.kind:
-            case "chat":
-                chat = self.query_one("#chat-panel", ChatPanel)
-                role = update.payload.get("role", "system")
-                content = update.payload.get("content", "")
-                chat.add_message(role, content)
-
-            case "sensors":
-                panel = self.query_one("#sensors-panel", SensorsPanel)
-                sensors = update.payload.get("sensors", {})
-                panel.update_sensors(sensors)
-
-            case "stance":
-                panel = self.query_one("#stance-panel", StancePanel)
-                stance = update.payload.get("stance", {})
-                changes = update.payload.get("changes", {})
-                panel.update_stance(stance, changes)
-
-            case "agents":
-                panel = self.query_one("#agents-panel", AgentsPanel)
-                if "started" in update.payload:
-                    panel.agent_started(update.payload["started"])
-                elif "completed" in update.payload:
-                    panel.agent_completed(update.payload["completed"])
-                elif "failed" in update.payload:
-                    panel.agent_failed(
-                        update.payload["failed"],
-                        update.payload.get("error", ""),
-                    )
-
-            case "critics":
-                panel = self.query_one("#critics-panel", CriticsPanel)
-                results = update.payload.get("results", [])
-                passed = update.payload.get("passed", True)
-                panel.update_results(results, passed)
-
-            case "activity":
-                panel = self.query_one("#activity-bar", ActivityPanel)
-                panel.update_state(update.payload)
+        handler = self._update_dispatch.get(update.kind)
+        if handler:
+            handler(update.payload)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Per-kind update handlers (see _update_dispatch in on_mount)
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _apply_chat(self, payload: dict) -> None:
+        role = payload.get("role", "system")
+        content = payload.get("content", "")
+        self._chat_panel.add_message(role, content)
+
+    def _apply_sensors(self, payload: dict) -> None:
+        self._sensors_panel.update_sensors(payload.get("sensors", {}))
+
+    def _apply_stance(self, payload: dict) -> None:
+        stance = payload.get("stance", {})
+        changes = payload.get("changes", {})
+        self._stance_panel.update_stance(stance, changes)
+
+    def _apply_agents(self, payload: dict) -> None:
+        panel = self._agents_panel
+        if "started" in payload:
+            panel.agent_started(payload["started"])
+        elif "completed" in payload:
+            panel.agent_completed(payload["completed"])
+        elif "failed" in payload:
+            panel.agent_failed(payload["failed"], payload.get("error", ""))
+
+    def _apply_critics(self, payload: dict) -> None:
+        results = payload.get("results", [])
+        passed = payload.get("passed", True)
+        self._critics_panel.update_results(results, passed)
+
+    def _apply_activity(self, payload: dict) -> None:
+        self._activity_panel.update_state(payload)
 
     async def _handle_command(self, command: str) -> None:
         """Handle slash commands."""
-        parts = command.split()
-        cmd = parts[0].lower()
-        args = parts[1:]
-
-        chat = self.query_one("#chat-panel", ChatPanel)
-
-        match cmd:
-            case "/help":
-                chat.add_message("system", self._help_text())
+        # partition avoids the list allocation of split(); commands are
+        # typed lowercase in practice, so only lowercase when needed
+        head, _, _args = command.partition(" ")
+        cmd = head if head.islower() else head.lower()
+
+        handler = self._cmd_table.get(cmd)
+        if handler:
+            handler()
+        else:
+            self._chat_panel.add_message(
+                "system", f"Unknown command: {cmd}. Type /help for help."
+            )
 
-            case "/clear":
-                chat.clear_messages()
-                self.projection.messages.clear()
-                self.notify("Chat cleared")
+    def _cmd_help(self) -> None:
+        self._chat_panel.add_message("system", self.HELP_TEXT)
 
-            case "/status":
-                status = self._get_status()
-                chat.add_message("system", status)
+    def _cmd_clear(self) -> None:
+        self._clear_chat()
+        self.notify("Chat cleared")
 
-            case "/session":
-                chat.add_message("system", f"Session ID: {self.session_id}")
+    def _cmd_status(self) -> None:
+        self._chat_panel.add_message("system", self._get_status())
 
-            case "/reset":
-                self.workspace.reset()
-                self.projection.reset_for_turn()
-                chat.add_message("system", "Workspace reset")
+    def _cmd_session(self) -> None:
+        self._chat_panel.add_message("system", f"Session ID: {self.session_id}")
 
-            case _:
-                chat.add_message("system", f"Unknown command: {cmd}. Type /help for help.")
+    def _cmd_reset(self) -> None:
+        self.workspace.reset()
+        self.projection.reset_for_turn()
+        self._chat_panel.add_message("system", "Workspace reset")
 
-    def _help_text(self) -> str:
-        """Generate help text."""
-        return """Commands:
+    # Static - rendered once at class creation, not per /help call
+    HELP_TEXT = """Commands:
 /help   - Show this help
 /clear  - Clear chat history
 /status - Show system status
@@ -319,7 +401,7 @@ Ctrl+L - Clear chat"""
             f"Processing: {self._processing}",
             f"Daemon: {'running' if self._daemon and self._daemon._running else 'stopped'}",
             f"Sensors: {len(self.projection.sensors)} active",
-            f"Messages: {len(self.projection.messages)}",
+            f"Messages: {self.projection.message_count}",
         ]
         return "\n".join(lines)
 
@@ -328,16 +410,20 @@ Ctrl+L - Clear chat"""
         reason = nudge.get("reason", "unknown")
         suggestion = nudge.get("suggestion", "")
 
-        chat = self.query_one("#chat-panel", ChatPanel)
-        chat.add_message("system", f"[Nudge: {reason}] {suggestion}")
+        self._chat_panel.add_message("system", f"[Nudge: {reason}] {suggestion}")
 
         if self._on_nudge:
             self._on_nudge(nudge)
 
+    def _clear_chat(self) -> None:
+        """Clear chat widget and projection state in one paint pass."""
+        with self.batch_update():
+            self._chat_panel.clear_messages()
+        self.projection.message_count = 0
+
     def action_clear(self) -> None:
         """Clear action for key binding."""
-        chat = self.query_one("#chat-panel", ChatPanel)
-        chat.clear_messages()
+        self._clear_chat()
 
     def action_quit(self) -> None:
         """Quit action for key binding."""
@@ -41,24 +41,49 @@ class ActivityPanel(Static):
     def __init__(self, **kwargs):
         super().__init__("○ Ready", **kwargs)
         self._stage = "idle"
+        self._stage_name = self.STAGE_NAMES["idle"]
+        self._icon = self.STAGE_ICONS["idle"]
         self._processing = False
         self._last_time = None
+        self._refresh_queued = False
+        self._rendered_key: tuple | None = None
 
     def update_state(self, payload: dict) -> None:
-        """Update activity state."""
+        """Update activity state.
+
+        Redraws are debounced: stage changes arrive in rapid bursts
+        during a turn, so consecutive updates within one frame collapse
+        into a single repaint of the latest state.
+        """
         if "stage" in payload:
-            self._stage = payload["stage"]
+            stage = payload["stage"]
+            if stage != self._stage:
+                # Derive display name/icon on transition, not per render
+                self._stage = stage
+                self._stage_name = self.STAGE_NAMES.get(stage, stage)
+                self._icon = self.STAGE_ICONS.get(stage.split("_r")[0], "●")
         if "processing" in payload:
             self._processing = payload["processing"]
         if "total_time_ms" in payload:
             self._last_time = payload["total_time_ms"]
 
+        if not self._refresh_queued:
+            self._refresh_queued = True
+            self.call_after_refresh(self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        """Apply the coalesced state to the display."""
+        self._refresh_queued = False
         self._refresh_display()
 
     def _refresh_display(self) -> None:
         """Render the activity indicator."""
-        stage_name = self.STAGE_NAMES.get(self._stage, self._stage)
-        icon = self.STAGE_ICONS.get(self._stage.split("_r")[0], "●")
+        # Deliberation re-emits the same stage many times - skip the
+        # repaint when nothing visible changed
+        key = (self._stage, self._processing, self._last_time)
+        if key == self._rendered_key:
+            return
+        self._rendered_key = key
 
         if self._processing:
             style = "bold cyan"
@@ -70,5 +95,5 @@ class ActivityPanel(Static):
             style = "dim"
             suffix = ""
 
-        text = Text(f"{icon} {stage_name}{suffix}", style=style)
+        text = Text(f"{self._icon} {self._stage_name}{suffix}", style=style)
         self.update(text)
@@ -3,18 +3,47 @@
 from textual.widgets import RichLog
 from rich.text import Text
 
+# Urgency -> (style, marker) lookup, one row per contract level (0-3);
+# index with min(urgency, 3) instead of re-branching per completion
+_URGENCY_STYLES = (
+    ("dim", ""),
+    ("white", "!"),
+    ("bold yellow", "!!"),
+    ("bold yellow", "!!!"),
+)
+
 
 class AgentsPanel(RichLog):
     """Panel showing agent activity."""
 
+    # Writes within this window are flushed together in one refresh
+    FLUSH_INTERVAL = 0.05
+
     def __init__(self, **kwargs):
         super().__init__(max_lines=50, **kwargs)
         self._active = set()
+        self._pending: list[Text] = []
+        self._flush_scheduled = False
+
+    def _queue(self, text: Text) -> None:
+        """Buffer a line; agent events arrive in rapid bursts, so
+        collapse a burst into a single batched write pass."""
+        self._pending.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.set_timer(self.FLUSH_INTERVAL, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        with self.app.batch_update():
+            for text in self._pending:
+                self.write(text)
+        self._pending.clear()
 
     def agent_started(self, agent_id: str) -> None:
         """Mark agent as started."""
         self._active.add(agent_id)
-        self.write(Text(f"▶ {agent_id}", style="dim"))
+        self._queue(Text(f"▶ {agent_id}", style="dim"))
 
     def agent_completed(self, log_entry: dict) -> None:
         """Show agent completion."""
@@ -24,19 +53,10 @@ class AgentsPanel(RichLog):
 
         self._active.discard(agent_id)
 
-        # Style based on urgency
-        if urgency >= 2:
-            style = "bold yellow"
-        elif urgency >= 1:
-            style = "white"
-        else:
-            style = "dim"
-
-        urgency_marker = "!" * urgency
-        text = Text(f"✓ {agent_id}: {observation} {urgency_marker}", style=style)
-        self.write(text)
+        style, urgency_marker = _URGENCY_STYLES[min(urgency, 3)]
+        self._queue(Text(f"✓ {agent_id}: {observation} {urgency_marker}", style=style))
 
     def agent_failed(self, agent_id: str, error: str) -> None:
         """Show agent failure."""
         self._active.discard(agent_id)
-        self.write(Text(f"✗ {agent_id}: {error[:40]}", style="red"))
+        self._queue(Text(f"✗ {agent_id}: {error[:40]}", style="red"))
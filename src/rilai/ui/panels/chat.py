@@ -1,27 +1,47 @@
 """Chat panel widget."""
 
 from textual.widgets import RichLog
+from rich.console import Group
 from rich.text import Text
 
 
+# Role prefixes built once at import - never mutated, safe to share
+_ROLE_PREFIXES = {
+    "user": Text("You: ", style="bold cyan"),
+    "assistant": Text("Rilai: ", style="bold green"),
+}
+_SYSTEM_PREFIX = Text("System: ", style="dim")
+
+
 class ChatPanel(RichLog):
     """Chat panel showing conversation history."""
 
+    # Oldest lines are evicted past this point - keeps memory bounded
+    # over long always-on sessions
+    MAX_LINES = 2000
+
+    # Above this size, skip Rich's syntax highlighter for the message
+    # body - scanning a very long reply blocks the event loop
+    HIGHLIGHT_LIMIT = 2000
+
     def __init__(self, **kwargs):
+        kwargs.setdefault("max_lines", self.MAX_LINES)
         super().__init__(highlight=True, markup=True, **kwargs)
 
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the chat."""
-        if role == "user":
-            prefix = Text("You: ", style="bold cyan")
-        elif role == "assistant":
-            prefix = Text("Rilai: ", style="bold green")
+        prefix = _ROLE_PREFIXES.get(role, _SYSTEM_PREFIX)
+
+        # RichLog only applies markup/highlighting to top-level strings,
+        # not to strings nested in a Group - pre-render the body here so
+        # the single grouped write keeps both
+        if len(content) <= self.HIGHLIGHT_LIMIT:
+            body = self.highlighter(Text.from_markup(content))
         else:
-            prefix = Text("System: ", style="dim")
+            body = Text(content)
 
-        self.write(prefix)
-        self.write(content)
-        self.write("")  # Blank line
+        # Single write per message - one render/scroll pass instead of three
+        self.write(Group(prefix, body, ""))
 
     def clear_messages(self) -> None:
         """Clear all messages."""
@@ -4,6 +4,14 @@ from textual.widgets import Static
 from rich.table import Table
 from rich.text import Text
 
+# Fixed status glyphs built once at import - Text objects are not
+# mutated by Table, so sharing across rows/repaints is safe
+_STATUS_PASS = Text("✓", style="green")
+_STATUS_BLOCK = Text("✗", style="bold red")
+_STATUS_WARN = Text("!", style="yellow")
+_STATUS_OTHER = Text("?", style="dim")
+_NO_RESULTS = Text("No critic results", style="dim")
+
 
 class CriticsPanel(Static):
     """Panel showing critic validation results."""
@@ -12,17 +20,44 @@ class CriticsPanel(Static):
         super().__init__("No critic results", **kwargs)
         self._results = []
         self._passed = True
+        self._fingerprint: tuple | None = None
+        self._dirty = False
 
     def update_results(self, results: list, passed: bool) -> None:
-        """Update critic results."""
+        """Update critic results.
+
+        Critic verdicts are usually identical turn to turn, so skip the
+        table rebuild when the visible fields have not changed.
+        """
         self._results = results
         self._passed = passed
+        fingerprint = (
+            passed,
+            tuple(
+                (r.get("critic_id"), r.get("passed"), r.get("severity"), r.get("message"))
+                for r in results
+            ),
+        )
+        if fingerprint == self._fingerprint:
+            return
+        self._fingerprint = fingerprint
+        if not self.is_on_screen:
+            # Pane is in a hidden tab - remember there is fresh state
+            # and repaint when it next becomes visible
+            self._dirty = True
+            return
         self._refresh_display()
 
+    def on_show(self) -> None:
+        """Repaint state that arrived while the tab was hidden."""
+        if self._dirty:
+            self._dirty = False
+            self._refresh_display()
+
     def _refresh_display(self) -> None:
         """Render the critics table."""
         if not self._results:
-            self.update(Text("No critic results", style="dim"))
+            self.update(_NO_RESULTS)
             return
 
         table = Table(box=None, padding=(0, 1))
@@ -31,19 +66,20 @@ class CriticsPanel(Static):
         table.add_column("Message", width=30)
 
         for result in self._results:
-            critic_id = result.get("critic_id", "?")
-            passed = result.get("passed", True)
-            severity = result.get("severity", "info")
-            message = result.get("message", "")
+            get = result.get
+            critic_id = get("critic_id", "?")
+            passed = get("passed", True)
+            severity = get("severity", "info")
+            message = get("message", "")
 
             if passed:
-                status = Text("✓", style="green")
+                status = _STATUS_PASS
             elif severity == "block":
-                status = Text("✗", style="bold red")
+                status = _STATUS_BLOCK
             elif severity == "warning":
-                status = Text("!", style="yellow")
+                status = _STATUS_WARN
             else:
-                status = Text("?", style="dim")
+                status = _STATUS_OTHER
 
             table.add_row(critic_id, status, message[:28] if message else "")
 
@@ -3,6 +3,9 @@
 from textual.widgets import Static
 from rich.table import Table
 
+# All 11 possible 10-cell bars, built once at import
+_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
 
 class SensorsPanel(Static):
     """Panel showing fast sensor readings."""
@@ -10,12 +13,39 @@ class SensorsPanel(Static):
     def __init__(self, **kwargs):
         super().__init__("No sensors", **kwargs)
         self._sensors = {}
+        self._fingerprint: tuple | None = None
+        self._dirty = False
+        self._sorted_keys: tuple[str, ...] | None = None
 
     def update_sensors(self, sensors: dict) -> None:
-        """Update sensor display."""
+        """Update sensor display.
+
+        Skips the repaint when the merged readings are identical to the
+        last render - sensor ticks frequently repeat values.
+        """
+        if sensors.keys() - self._sensors.keys():
+            # New sensor id - recompute the display order
+            self._sorted_keys = None
         self._sensors.update(sensors)
+        if self._sorted_keys is None:
+            self._sorted_keys = tuple(sorted(self._sensors))
+        fingerprint = tuple(self._sensors[k] for k in self._sorted_keys)
+        if fingerprint == self._fingerprint:
+            return
+        self._fingerprint = fingerprint
+        if not self.is_on_screen:
+            # Pane is in a hidden tab - remember there is fresh state
+            # and repaint when it next becomes visible
+            self._dirty = True
+            return
         self._refresh_display()
 
+    def on_show(self) -> None:
+        """Repaint state that arrived while the tab was hidden."""
+        if self._dirty:
+            self._dirty = False
+            self._refresh_display()
+
     def _refresh_display(self) -> None:
         """Render the sensors table."""
         if not self._sensors:
@@ -26,11 +56,11 @@ class SensorsPanel(Static):
         table.add_column("Sensor", style="cyan")
         table.add_column("Value", justify="right")
 
-        for sensor, value in sorted(self._sensors.items()):
+        for sensor in self._sorted_keys:
+            value = self._sensors[sensor]
             # Format as percentage or bar
             if isinstance(value, float):
-                bar_len = int(value * 10)
-                bar = "█" * bar_len + "░" * (10 - bar_len)
+                bar = _BARS[max(0, min(10, int(value * 10)))]
                 display = f"{bar} {value:.0%}"
             else:
                 display = str(value)
@@ -4,6 +4,29 @@ from textual.widgets import Static
 from rich.table import Table
 from rich.text import Text
 
+# Shared empty delta cell - the common case when a dimension is stable
+_NO_CHANGE = Text("", style="dim")
+
+# All 11 possible marker bars, built once at import
+_BARS = tuple("─" * i + "●" + "─" * (10 - i) for i in range(11))
+
+# Display order of stance dimensions with precomputed render metadata:
+# (name, row label, bar scale, bar offset). valence is signed [-1, 1],
+# the rest are [0, 1]; bar_pos = int((value + offset) * scale).
+_STANCE_DIMS = tuple(
+    (name, name[:8], 5 if name == "valence" else 10, 1 if name == "valence" else 0)
+    for name in (
+        "valence",
+        "arousal",
+        "strain",
+        "closeness",
+        "certainty",
+        "safety",
+        "curiosity",
+        "control",
+    )
+)
+
 
 class StancePanel(Static):
     """Panel showing stance vector."""
@@ -12,13 +35,37 @@ class StancePanel(Static):
         super().__init__("No stance data", **kwargs)
         self._stance = {}
         self._changes = {}
+        self._fingerprint: tuple | None = None
+        self._dirty = False
 
     def update_stance(self, stance: dict, changes: dict = None) -> None:
-        """Update stance display."""
+        """Update stance display.
+
+        The projection passes its live dicts, so fingerprint the values
+        per dimension and skip the repaint when nothing moved.
+        """
         self._stance = stance
         self._changes = changes or {}
+        fingerprint = tuple(
+            (self._stance.get(dim, 0.0), self._changes.get(dim, 0.0))
+            for dim, _, _, _ in _STANCE_DIMS
+        )
+        if fingerprint == self._fingerprint:
+            return
+        self._fingerprint = fingerprint
+        if not self.is_on_screen:
+            # Pane is in a hidden tab - remember there is fresh state
+            # and repaint when it next becomes visible
+            self._dirty = True
+            return
         self._refresh_display()
 
+    def on_show(self) -> None:
+        """Repaint state that arrived while the tab was hidden."""
+        if self._dirty:
+            self._dirty = False
+            self._refresh_display()
+
     def _refresh_display(self) -> None:
         """Render the stance table."""
         if not self._stance:
@@ -30,23 +77,22 @@ class StancePanel(Static):
         table.add_column("Value", justify="center", width=12)
         table.add_column("Δ", justify="right", width=6)
 
-        for dim in ["valence", "arousal", "strain", "closeness", "certainty", "safety", "curiosity", "control"]:
+        for dim, label, scale, offset in _STANCE_DIMS:
             value = self._stance.get(dim, 0.0)
             change = self._changes.get(dim, 0.0)
 
             # Visual bar
-            bar_pos = int((value + 1) * 5) if dim == "valence" else int(value * 10)
-            bar_pos = max(0, min(10, bar_pos))
-            bar = "─" * bar_pos + "●" + "─" * (10 - bar_pos)
+            bar = _BARS[max(0, min(10, int((value + offset) * scale)))]
 
-            # Change indicator
+            # Change indicator; styles are plain Text, so no markup
+            # parser runs on refresh
             if change > 0.01:
                 change_text = Text(f"+{change:.2f}", style="green")
             elif change < -0.01:
                 change_text = Text(f"{change:.2f}", style="red")
             else:
-                change_text = Text("", style="dim")
+                change_text = _NO_CHANGE
 
-            table.add_row(dim[:8], bar, change_text)
+            table.add_row(label, bar, change_text)
 
         self.update(table)
@@ -1,10 +1,18 @@
 """TurnStateProjection - maintains UI state from event stream."""
 
 from dataclasses import dataclass, field
-from typing import Literal, List, Dict, Any
+from typing import Any, Callable, ClassVar, Dict, List, Literal, Set, Tuple
 
 from rilai.contracts.events import EngineEvent, EventKind
 
+# %-template is a C-level fast path; these lines are rebuilt per agent
+# on every summary refresh
+_AGENT_LINE = "%s: %s %s"
+
+# Below this, a stance/sensor change is visually indistinguishable from
+# noise - skip the UI update entirely
+_EPSILON = 1e-3
+
 
 UIUpdateKind = Literal[
     "sensors", "stance", "agents", "workspace",
@@ -12,9 +20,13 @@ UIUpdateKind = Literal[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class UIUpdate:
-    """A single UI update to apply."""
+    """A single UI update to apply.
+
+    Slotted: several of these are allocated per engine event, so skip
+    the per-instance __dict__.
+    """
     kind: UIUpdateKind
     payload: Dict[str, Any]
 
@@ -37,7 +49,7 @@ class TurnStateProjection:
 
     # Agent activity
     agent_logs: List[Dict[str, Any]] = field(default_factory=list)
-    active_agents: List[str] = field(default_factory=list)
+    active_agents: Set[str] = field(default_factory=set)
 
     # Workspace
     workspace: Dict[str, Any] = field(default_factory=dict)
@@ -50,157 +62,190 @@ class TurnStateProjection:
     # Memory
     memory_summary: Dict[str, Any] = field(default_factory=dict)
 
-    # Chat
-    messages: List[Dict[str, str]] = field(default_factory=list)
+    # Chat; only the count is retained - ChatPanel owns the transcript,
+    # so mirroring every message here grew memory without bound
+    message_count: int = 0
 
     # Activity
     current_stage: str = "idle"
     turn_id: int = 0
     processing: bool = False
 
-    def apply_event(self, event: EngineEvent) -> List[UIUpdate]:
+    def apply_event(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
         """Apply event and return UI updates.
 
         This is the main entry point. Each event type produces
-        zero or more UI updates.
+        zero or more UI updates as a tuple - the no-op case returns
+        the shared empty tuple, so unmatched events allocate nothing.
+        Dispatch is a single dict lookup on the event kind (see
+        _HANDLERS below).
         """
-        updates = []
-
-        match event.kind:
-            # Turn lifecycle
-            case EventKind.TURN_STARTED:
-                self.processing = True
-                self.turn_id = event.payload.get("turn_id", 0)
-                user_input = event.payload.get("user_input", "")
-                self.messages.append({"role": "user", "content": user_input})
-                updates.append(UIUpdate("chat", {"role": "user", "content": user_input}))
-                updates.append(UIUpdate("activity", {"stage": "starting", "processing": True}))
-
-            case EventKind.TURN_STAGE_CHANGED:
-                self.current_stage = event.payload.get("stage", "idle")
-                updates.append(UIUpdate("activity", {"stage": self.current_stage}))
-
-            case EventKind.TURN_COMPLETED:
-                self.processing = False
-                total_time = event.payload.get("total_time_ms", 0)
-                updates.append(UIUpdate("activity", {
-                    "stage": "completed",
-                    "processing": False,
-                    "total_time_ms": total_time,
-                }))
-
-            # Sensors
-            case EventKind.SENSORS_FAST_UPDATED:
-                new_sensors = event.payload.get("sensors", {})
-                self.sensors.update(new_sensors)
-                updates.append(UIUpdate("sensors", {"sensors": self.sensors}))
-
-            # Stance
-            case EventKind.STANCE_UPDATED:
-                delta = event.payload.get("delta", {})
-                for key, change in delta.items():
-                    old_val = self.stance.get(key, 0.0)
-                    self.stance[key] = old_val + change
-                    self.stance_changes[key] = change
-                updates.append(UIUpdate("stance", {
-                    "stance": self.stance,
-                    "changes": self.stance_changes,
-                }))
-
-            # Agents
-            case EventKind.AGENT_STARTED:
-                agent_id = event.payload.get("agent_id", "?")
-                self.active_agents.append(agent_id)
-                updates.append(UIUpdate("agents", {"started": agent_id}))
-
-            case EventKind.AGENT_COMPLETED:
-                agent_id = event.payload.get("agent_id", "?")
-                observation = event.payload.get("observation", "")
-                salience = event.payload.get("salience", 0.0)
-                urgency = event.payload.get("urgency", 0)
-                processing_time = event.payload.get("processing_time_ms", 0)
-
-                if agent_id in self.active_agents:
-                    self.active_agents.remove(agent_id)
-
-                # Only log non-quiet observations
-                if observation and observation.lower() != "quiet":
-                    log_entry = {
-                        "agent_id": agent_id,
-                        "observation": observation,
-                        "salience": salience,
-                        "urgency": urgency,
-                        "time_ms": processing_time,
-                    }
-                    self.agent_logs.append(log_entry)
-                    updates.append(UIUpdate("agents", {"completed": log_entry}))
-
-            case EventKind.AGENT_FAILED:
-                agent_id = event.payload.get("agent_id", "?")
-                error = event.payload.get("error", "Unknown error")
-                if agent_id in self.active_agents:
-                    self.active_agents.remove(agent_id)
-                updates.append(UIUpdate("agents", {"failed": agent_id, "error": error}))
-
-            # Workspace
-            case EventKind.WORKSPACE_PATCHED:
-                patch = event.payload.get("patch", {})
-                self.workspace.update(patch)
-                updates.append(UIUpdate("workspace", {"patch": patch}))
-
-            # Deliberation
-            case EventKind.DELIB_ROUND_STARTED:
-                round_num = event.payload.get("round", 0)
-                updates.append(UIUpdate("activity", {"stage": f"deliberation_r{round_num}"}))
-
-            case EventKind.CONSENSUS_UPDATED:
-                self.consensus = event.payload.get("score", 0.0)
-                updates.append(UIUpdate("workspace", {"consensus": self.consensus}))
-
-            # Council
-            case EventKind.COUNCIL_DECISION_MADE:
-                decision = {
-                    "speak": event.payload.get("speak", False),
-                    "urgency": event.payload.get("urgency", "low"),
-                    "intent": event.payload.get("intent"),
-                }
-                updates.append(UIUpdate("workspace", {"decision": decision}))
-
-            # Voice
-            case EventKind.VOICE_RENDERED:
-                text = event.payload.get("text", "")
-                if text:
-                    self.messages.append({"role": "assistant", "content": text})
-                    updates.append(UIUpdate("chat", {"role": "assistant", "content": text}))
-
-            # Critics
-            case EventKind.CRITICS_UPDATED:
-                self.critics = event.payload.get("results", [])
-                passed = event.payload.get("passed", True)
-                updates.append(UIUpdate("critics", {
-                    "results": self.critics,
-                    "passed": passed,
-                }))
-
-            # Memory
-            case EventKind.MEMORY_COMMITTED:
-                self.memory_summary = event.payload.get("summary", {})
-                updates.append(UIUpdate("memory", {"summary": self.memory_summary}))
-
-            # Safety
-            case EventKind.SAFETY_INTERRUPT:
-                reason = event.payload.get("reason", "Unknown")
-                updates.append(UIUpdate("activity", {"safety_interrupt": reason}))
-
-            # Daemon
-            case EventKind.PROACTIVE_NUDGE:
-                nudge = event.payload
-                updates.append(UIUpdate("chat", {
-                    "role": "system",
-                    "content": f"[Nudge: {nudge.get('reason', '?')}]",
-                }))
-
-        return updates
+        handler = self._HANDLERS.get(event.kind)
+        return handler(self, event) if handler else ()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Per-kind event handlers
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _on_turn_started(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        self.processing = True
+        self.turn_id = event.payload.get("turn_id", 0)
+        user_input = event.payload.get("user_input", "")
+        self.message_count += 1
+        return (
+            UIUpdate("chat", {"role": "user", "content": user_input}),
+            UIUpdate("activity", {"stage": "starting", "processing": True}),
+        )
+
+    def _on_turn_stage_changed(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        self.current_stage = event.payload.get("stage", "idle")
+        return (UIUpdate("activity", {"stage": self.current_stage}),)
+
+    def _on_turn_completed(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        self.processing = False
+        total_time = event.payload.get("total_time_ms", 0)
+        return (UIUpdate("activity", {
+            "stage": "completed",
+            "processing": False,
+            "total_time_ms": total_time,
+        }),)
+
+    def _on_sensors_fast_updated(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        new_sensors = event.payload.get("sensors", {})
+        sensors = self.sensors
+        changed = {
+            k: v for k, v in new_sensors.items()
+            if k not in sensors or abs(v - sensors[k]) > _EPSILON
+        }
+        if not changed:
+            return ()
+        sensors.update(changed)
+        return (UIUpdate("sensors", {"sensors": sensors}),)
+
+    def _on_stance_updated(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        delta = event.payload.get("delta", {})
+        moved = False
+        for key, change in delta.items():
+            if abs(change) < _EPSILON:
+                continue
+            old_val = self.stance.get(key, 0.0)
+            self.stance[key] = old_val + change
+            self.stance_changes[key] = change
+            moved = True
+        if not moved:
+            return ()
+        return (UIUpdate("stance", {
+            "stance": self.stance,
+            "changes": self.stance_changes,
+        }),)
+
+    def _on_agent_started(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        agent_id = event.payload.get("agent_id", "?")
+        self.active_agents.add(agent_id)
+        return (UIUpdate("agents", {"started": agent_id}),)
+
+    def _on_agent_completed(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        # Bind the bound method once - this fires per agent per turn
+        get = event.payload.get
+        agent_id = get("agent_id", "?")
+        observation = get("observation", "")
+        salience = get("salience", 0.0)
+        urgency = get("urgency", 0)
+        processing_time = get("processing_time_ms", 0)
+
+        self.active_agents.discard(agent_id)
+
+        # Only log non-quiet observations; length-gate the lower() so
+        # real observations never pay for the lowercased copy
+        if observation and (len(observation) != 5 or observation.lower() != "quiet"):
+            log_entry = {
+                "agent_id": agent_id,
+                "observation": observation,
+                "salience": salience,
+                "urgency": urgency,
+                "time_ms": processing_time,
+            }
+            self.agent_logs.append(log_entry)
+            return (UIUpdate("agents", {"completed": log_entry}),)
+        return ()
+
+    def _on_agent_failed(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        agent_id = event.payload.get("agent_id", "?")
+        error = event.payload.get("error", "Unknown error")
+        self.active_agents.discard(agent_id)
+        return (UIUpdate("agents", {"failed": agent_id, "error": error}),)
+
+    def _on_workspace_patched(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        patch = event.payload.get("patch", {})
+        self.workspace.update(patch)
+        return (UIUpdate("workspace", {"patch": patch}),)
+
+    def _on_delib_round_started(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        round_num = event.payload.get("round", 0)
+        return (UIUpdate("activity", {"stage": f"deliberation_r{round_num}"}),)
+
+    def _on_consensus_updated(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        self.consensus = event.payload.get("score", 0.0)
+        return (UIUpdate("workspace", {"consensus": self.consensus}),)
+
+    def _on_council_decision_made(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        decision = {
+            "speak": event.payload.get("speak", False),
+            "urgency": event.payload.get("urgency", "low"),
+            "intent": event.payload.get("intent"),
+        }
+        return (UIUpdate("workspace", {"decision": decision}),)
+
+    def _on_voice_rendered(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        text = event.payload.get("text", "")
+        if text:
+            self.message_count += 1
+            return (UIUpdate("chat", {"role": "assistant", "content": text}),)
+        return ()
+
+    def _on_critics_updated(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        self.critics = event.payload.get("results", [])
+        passed = event.payload.get("passed", True)
+        return (UIUpdate("critics", {
+            "results": self.critics,
+            "passed": passed,
+        }),)
+
+    def _on_memory_committed(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        self.memory_summary = event.payload.get("summary", {})
+        return (UIUpdate("memory", {"summary": self.memory_summary}),)
+
+    def _on_safety_interrupt(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        reason = event.payload.get("reason", "Unknown")
+        return (UIUpdate("activity", {"safety_interrupt": reason}),)
+
+    def _on_proactive_nudge(self, event: EngineEvent) -> Tuple[UIUpdate, ...]:
+        nudge = event.payload
+        return (UIUpdate("chat", {
+            "role": "system",
+            "content": f"[Nudge: {nudge.get('reason', '?')}]",
+        }),)
+
+    # EventKind -> handler, built once at class creation
+    _HANDLERS: ClassVar[Dict[EventKind, Callable[..., Tuple[UIUpdate, ...]]]] = {
+        EventKind.TURN_STARTED: _on_turn_started,
+        EventKind.TURN_STAGE_CHANGED: _on_turn_stage_changed,
+        EventKind.TURN_COMPLETED: _on_turn_completed,
+        EventKind.SENSORS_FAST_UPDATED: _on_sensors_fast_updated,
+        EventKind.STANCE_UPDATED: _on_stance_updated,
+        EventKind.AGENT_STARTED: _on_agent_started,
+        EventKind.AGENT_COMPLETED: _on_agent_completed,
+        EventKind.AGENT_FAILED: _on_agent_failed,
+        EventKind.WORKSPACE_PATCHED: _on_workspace_patched,
+        EventKind.DELIB_ROUND_STARTED: _on_delib_round_started,
+        EventKind.CONSENSUS_UPDATED: _on_consensus_updated,
+        EventKind.COUNCIL_DECISION_MADE: _on_council_decision_made,
+        EventKind.VOICE_RENDERED: _on_voice_rendered,
+        EventKind.CRITICS_UPDATED: _on_critics_updated,
+        EventKind.MEMORY_COMMITTED: _on_memory_committed,
+        EventKind.SAFETY_INTERRUPT: _on_safety_interrupt,
+        EventKind.PROACTIVE_NUDGE: _on_proactive_nudge,
+    }
 
     def reset_for_turn(self) -> None:
         """Reset transient state for new turn."""
@@ -217,9 +262,9 @@ class TurnStateProjection:
         if not self.agent_logs:
             return "No agent activity"
 
-        lines = []
-        for log in self.agent_logs[-10:]:
-            urgency_marker = "!" * log.get("urgency", 0)
-            lines.append(f"{log['agent_id']}: {log['observation'][:60]} {urgency_marker}")
-
+        lines = [
+            _AGENT_LINE
+            % (log["agent_id"], log["observation"][:60], "!" * log.get("urgency", 0))
+            for log in self.agent_logs[-10:]
+        ]
         return "\n".join(lines)
@@ -0,0 +1,28 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from rilai.contracts.agent import AgentManifest
+
+
+@pytest.fixture
+def make_manifest():
+    """Factory for test manifests.
+
+    Built with model_construct - the fields are trusted literals, so
+    skipping pydantic validation shaves the construction cost off every
+    test that needs a manifest.
+    """
+
+    def _make(**overrides):
+        fields = {
+            "id": "test.agent",
+            "display_name": "Test Agent",
+            "inputs": ["user_message"],
+            "outputs": ["observation"],
+            "prompt_template": "test.md",
+        }
+        fields.update(overrides)
+        return AgentManifest.model_construct(**fields)
+
+    return _make
@@ -4,7 +4,7 @@ import pytest
 from pathlib import Path
 import tempfile
 
-from rilai.contracts.agent import AgentManifest, AgentPriority, AgentOutput
+from rilai.contracts.agent import AgentPriority, AgentOutput
 from rilai.agents.manifest import load_manifest, load_prompt, discover_agents
 from rilai.agents.base_v3 import BaseAgent
 from rilai.agents.registry import AgentRegistry, get_registry, reset_registry
@@ -72,27 +72,13 @@ prompt_template: test.md
 
 
 class TestBaseAgent:
-    def test_agent_creation(self):
-        manifest = AgentManifest(
-            id="test.agent",
-            display_name="Test Agent",
-            inputs=["user_message"],
-            outputs=["observation"],
-            prompt_template="test.md",
-        )
-        agent = BaseAgent(manifest, "# Test prompt")
+    def test_agent_creation(self, make_manifest):
+        agent = BaseAgent(make_manifest(), "# Test prompt")
         assert agent.agent_id == "test.agent"
 
     @pytest.mark.asyncio
-    async def test_agent_quiet_output(self):
-        manifest = AgentManifest(
-            id="test.agent",
-            display_name="Test Agent",
-            inputs=["user_message"],
-            outputs=["observation"],
-            prompt_template="test.md",
-        )
-        agent = BaseAgent(manifest, "# Test prompt")
+    async def test_agent_quiet_output(self, make_manifest):
+        agent = BaseAgent(make_manifest(), "# Test prompt")
         workspace = Workspace()
         workspace.set_user_message("Hello")
 
@@ -101,15 +87,8 @@ class TestBaseAgent:
         assert output.agent_id == "test.agent"
         assert output.observation == "Quiet"
 
-    def test_parse_response_json(self):
-        manifest = AgentManifest(
-            id="test.agent",
-            display_name="Test",
-            inputs=["user_message"],
-            outputs=["observation"],
-            prompt_template="test.md",
-        )
-        agent = BaseAgent(manifest, "")
+    def test_parse_response_json(self, make_manifest):
+        agent = BaseAgent(make_manifest(display_name="Test"), "")
 
         response = '{"observation": "Test observation", "urgency": 2, "confidence": 2, "claims": []}'
         output = agent._parse_response(response)
@@ -118,15 +97,8 @@ class TestBaseAgent:
         assert output.urgency == 2
         assert output.confidence == 2
 
-    def test_parse_response_with_claims(self):
-        manifest = AgentManifest(
-            id="test.agent",
-            display_name="Test",
-            inputs=["user_message"],
-            outputs=["observation"],
-            prompt_template="test.md",
-        )
-        agent = BaseAgent(manifest, "")
+    def test_parse_response_with_claims(self, make_manifest):
+        agent = BaseAgent(make_manifest(display_name="Test"), "")
 
         response = '''
 {
@@ -143,15 +115,8 @@ class TestBaseAgent:
         assert len(output.claims) == 1
         assert output.claims[0].text == "User shows stress"
 
-    def test_extract_json_from_code_block(self):
-        manifest = AgentManifest(
-            id="test.agent",
-            display_name="Test",
-            inputs=["user_message"],
-            outputs=["observation"],
-            prompt_template="test.md",
-        )
-        agent = BaseAgent(manifest, "")
+    def test_extract_json_from_code_block(self, make_manifest):
+        agent = BaseAgent(make_manifest(display_name="Test"), "")
 
         content = '''Here is my analysis:
 ```json
@@ -167,38 +132,27 @@ class TestAgentRegistry:
         registry = AgentRegistry()
         assert len(registry.manifests) == 0
 
-    def test_register_agent(self):
+    def test_register_agent(self, make_manifest):
         registry = AgentRegistry()
-        manifest = AgentManifest(
-            id="test.agent",
-            display_name="Test",
-            inputs=["user_message"],
-            outputs=["observation"],
-            prompt_template="test.md",
-        )
-        registry.register_agent(manifest, "# Test")
+        registry.register_agent(make_manifest(display_name="Test"), "# Test")
 
         assert "test.agent" in registry.manifests
         assert registry.get_agent("test.agent") is not None
 
-    def test_get_agents_by_agency(self):
+    def test_get_agents_by_agency(self, make_manifest):
         registry = AgentRegistry()
 
         for name in ["stress", "wellbeing"]:
-            manifest = AgentManifest(
+            manifest = make_manifest(
                 id=f"emotion.{name}",
                 display_name=name,
-                inputs=["user_message"],
-                outputs=["observation"],
                 prompt_template=f"{name}.md",
             )
             registry.register_agent(manifest, "# Test")
 
-        manifest = AgentManifest(
+        manifest = make_manifest(
             id="planning.short_term",
             display_name="Short Term",
-            inputs=["user_message"],
-            outputs=["observation"],
             prompt_template="short_term.md",
         )
         registry.register_agent(manifest, "# Test")
@@ -206,23 +160,17 @@ class TestAgentRegistry:
         emotion_agents = registry.get_agents_by_agency("emotion")
         assert len(emotion_agents) == 2
 
-    def test_get_always_on_agents(self):
+    def test_get_always_on_agents(self, make_manifest):
         registry = AgentRegistry()
 
-        manifest1 = AgentManifest(
+        manifest1 = make_manifest(
             id="test.always",
             display_name="Always On",
-            inputs=["user_message"],
-            outputs=["observation"],
-            prompt_template="test.md",
             priority=AgentPriority.ALWAYS_ON,
         )
-        manifest2 = AgentManifest(
+        manifest2 = make_manifest(
             id="test.normal",
             display_name="Normal",
-            inputs=["user_message"],
-            outputs=["observation"],
-            prompt_template="test.md",
             priority=AgentPriority.NORMAL,
         )
         registry.register_agent(manifest1, "# Test")
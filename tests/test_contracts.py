@@ -105,8 +105,8 @@ class TestClaim:
             confidence=2,
         )
         assert claim.type == ClaimType.RECOMMENDATION
-        assert claim.supports == []
-        assert claim.opposes == []
+        assert claim.supports == ()
+        assert claim.opposes == ()
 
     def test_claim_with_relations(self):
         claim = Claim(
@@ -20,9 +20,9 @@ class TestProjection:
 
         updates = projection.apply_event(event)
 
-        assert any(u.kind == "chat" for u in updates)
-        assert projection.messages[-1]["role"] == "user"
-        assert projection.messages[-1]["content"] == "Hello"
+        chat_updates = [u for u in updates if u.kind == "chat"]
+        assert chat_updates[0].payload == {"role": "user", "content": "Hello"}
+        assert projection.message_count == 1
 
     def test_agent_completed_logs_non_quiet(self):
         projection = TurnStateProjection()
@@ -83,8 +83,9 @@ class TestProjection:
 
         updates = projection.apply_event(event)
 
-        assert any(u.kind == "chat" for u in updates)
-        assert projection.messages[-1]["role"] == "assistant"
+        chat_updates = [u for u in updates if u.kind == "chat"]
+        assert chat_updates[0].payload["role"] == "assistant"
+        assert projection.message_count == 1
 
     def test_reset_for_turn_clears_transient(self):
         projection = TurnStateProjection()
@@ -150,6 +150,34 @@ class TestReducer:
         assert len(ws.active_claims) == 1
         assert ws.active_claims[0].urgency == 2
 
+    def test_claim_merged_twice(self):
+        # The second merge operates on the field the first merge
+        # assigned, so this catches type drift in the merge path
+        ws = Workspace()
+
+        for claim_id, supports in [("1", ()), ("2", ("c0",)), ("3", ("c9",))]:
+            claim = Claim(
+                id=claim_id,
+                text="User appears stressed",
+                type=ClaimType.OBSERVATION,
+                source_agent="emotion.stress",
+                urgency=1,
+                confidence=2,
+                supports=supports,
+            )
+            output = AgentOutput(
+                agent_id="emotion.stress",
+                observation="o",
+                salience=0.5,
+                urgency=1,
+                confidence=2,
+                claims=[claim],
+            )
+            ws.apply_agent_output(output)
+
+        assert len(ws.active_claims) == 1
+        assert set(ws.active_claims[0].supports) == {"c0", "c9"}
+
 
 class TestClaimsSimilar:
     def test_identical_claims(self):